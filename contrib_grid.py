@@ -0,0 +1,124 @@
+"""
+contrib_grid.py
+Descarga y parseo de la cuadrícula de contribuciones de GitHub.
+Lógica compartida por busca_minas.py y generate_contributions.py para no
+duplicar el fetch ni el parser en cada entrypoint.
+"""
+
+import os
+import re
+import asyncio
+import requests
+import httpx
+from requests.adapters import HTTPAdapter, Retry
+from functools import lru_cache
+import numpy as np
+
+# sesión con keep-alive y reintentos: reutiliza la conexión TCP+TLS
+# entre llamadas en vez de negociar un handshake nuevo por petición
+SESSION = requests.Session()
+SESSION.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=4,
+                                      max_retries=Retry(total=3, backoff_factor=0.2)))
+
+# cache sidecar con ETag: si el endpoint responde 304 reutilizamos el
+# cuerpo guardado y nos ahorramos la descarga (y el reparseo es trivial)
+CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "gh-contribs")
+
+def fetch_contributions_svg(username):
+    url = f"https://github.com/users/{username}/contributions"
+    etag_path = os.path.join(CACHE_DIR, f"{username}.etag")
+    body_path = os.path.join(CACHE_DIR, f"{username}.svg")
+    headers = {}
+    if os.path.exists(etag_path) and os.path.exists(body_path):
+        with open(etag_path) as f:
+            headers["If-None-Match"] = f.read().strip()
+    r = SESSION.get(url, timeout=10, headers=headers)
+    if r.status_code == 304:
+        # sin cambios desde la última ejecución: cuerpo cacheado
+        with open(body_path, "rb") as f:
+            return f.read()
+    if r.status_code != 200:
+        raise Exception(f"No se pudo obtener SVG de contribuciones: status {r.status_code}")
+    etag = r.headers.get("ETag")
+    if etag:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        with open(body_path, "wb") as f:
+            f.write(r.content)
+        with open(etag_path, "w") as f:
+            f.write(etag)
+    return r.content
+
+async def fetch_contributions_batch(users):
+    # modo batch: descargamos todos los usuarios en paralelo; HTTP/2
+    # multiplexa las peticiones sobre una sola conexión
+    async def fetch(client, u):
+        r = await client.get(f"https://github.com/users/{u}/contributions")
+        if r.status_code != 200:
+            raise Exception(f"No se pudo obtener SVG de contribuciones de {u}: status {r.status_code}")
+        return u, r.content
+    limits = httpx.Limits(max_connections=5)
+    async with httpx.AsyncClient(http2=True, limits=limits, timeout=10) as client:
+        return await asyncio.gather(*(fetch(client, u) for u in users))
+
+# lo único que extraemos de cada <rect> son data-date y data-count: una
+# regex compilada los saca en una sola pasada C-level por el buffer, sin
+# construir ningún árbol; los lookaheads hacen que las capturas no
+# dependan del orden de los atributos dentro del tag
+_RECT_RE = re.compile(rb'<rect\b(?=[^>]*\bdata-date="([^"]+)")(?=[^>]*\bdata-count="([^"]+)")[^>]*>')
+
+def iter_rects(svg_bytes):
+    # operamos sobre bytes (resp.content): nos saltamos el decode del
+    # documento entero, solo se decodifican los atributos capturados
+    for m in _RECT_RE.finditer(svg_bytes):
+        yield m.group(1).decode(), m.group(2).decode()
+
+# la cuadrícula de GitHub es siempre <=53 semanas x 7 días: con la forma
+# fija preasignamos las matrices y no hace falta escanear máximos ni
+# rellenar columnas cortas
+COLS, ROWS = 53, 7
+
+def _date_ordinal_dow(s):
+    # "YYYY-MM-DD" -> (días desde 1970-01-01, día de la semana con domingo=0)
+    # aritmética de dígitos + days_from_civil: ni strptime ni un objeto
+    # date por rect, solo enteros
+    y = (ord(s[0])-48)*1000 + (ord(s[1])-48)*100 + (ord(s[2])-48)*10 + (ord(s[3])-48)
+    m = (ord(s[5])-48)*10 + (ord(s[6])-48)
+    d = (ord(s[8])-48)*10 + (ord(s[9])-48)
+    y -= m <= 2
+    era = y // 400
+    yoe = y - era*400
+    doy = (153*(m + (-3 if m > 2 else 9)) + 2)//5 + d - 1
+    doe = yoe*365 + yoe//4 - yoe//100 + doy
+    days = era*146097 + doe - 719468
+    # 1970-01-01 fue jueves (índice 4 con domingo=0)
+    return days, (days + 4) % 7
+
+def parse_svg_to_grid(svg_bytes):
+    # la fecha ES la coordenada: semana y día de la semana salen de
+    # data-date, así que ya no hay sort, agrupación ni atributos x/y
+    rects = []
+    for d, c in iter_rects(svg_bytes):
+        ordinal, dow = _date_ordinal_dow(d)
+        rects.append((ordinal, dow, d, int(c)))
+    if not rects:
+        return []
+    counts = np.zeros((COLS, ROWS), dtype=np.int32)
+    dates = np.empty((COLS, ROWS), dtype=object)
+    first = min(r[0] for r in rects)
+    last = max(r[0] for r in rects)
+    # alineamos al domingo de la primera semana (fila 0 = domingo)
+    start = first - (first + 4) % 7
+    for ordinal, dow, date_str, count in rects:
+        week = (ordinal - start) // 7
+        if week < COLS:
+            counts[week, dow] = count
+            dates[week, dow] = date_str
+    ncols = min((last - start) // 7 + 1, COLS)
+    return [[{"date": dates[c, r], "count": int(counts[c, r])} for r in range(ROWS)]
+            for c in range(ncols)]
+
+@lru_cache(maxsize=8)
+def fetch_and_parse(username):
+    # memoizado: pedir el mismo usuario dos veces en el mismo proceso
+    # (p.ej. markdown + JSON) no repite ni la descarga ni el parseo
+    return parse_svg_to_grid(fetch_contributions_svg(username))
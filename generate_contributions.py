@@ -0,0 +1,47 @@
+#!/usr/bin/env python3
+"""
+generate_contributions.py
+Genera contributions.json con la cuadrícula de contribuciones de GitHub
+Uso: python generate_contributions.py <github_username> [--outfile fichero.json]
+Salida: JSON {"username", "generated", "weeks"} que consume index.html
+"""
+
+import sys
+import argparse
+import orjson
+from datetime import datetime, timezone
+
+from contrib_grid import fetch_and_parse
+
+def main():
+    parser = argparse.ArgumentParser(description="Genera contributions.json desde las contribuciones de GitHub")
+    parser.add_argument("username", help="GitHub username (ej: EmmanuelPerezVivas)")
+    parser.add_argument("--outfile", "-o", default="contributions.json", help="Archivo de salida (por defecto contributions.json).")
+    parser.add_argument("--compact", action="store_true", help="Sin indentar: mitad de tamaño, ideal para CI donde nadie lee el JSON.")
+    args = parser.parse_args()
+
+    try:
+        weeks = fetch_and_parse(args.username)
+    except Exception as e:
+        print(f"[ERROR] {e}")
+        sys.exit(1)
+
+    if not weeks:
+        print("[ERROR] No se pudo construir la cuadrícula de contribuciones")
+        sys.exit(1)
+
+    output = {
+        "username": args.username,
+        # orjson serializa datetime nativamente; OPT_UTC_Z emite el sufijo Z
+        "generated": datetime.now(timezone.utc),
+        "weeks": [[{"date": e["date"], "count": e["count"]} for e in col] for col in weeks],
+    }
+    # orjson escribe bytes UTF-8 en una pasada, ~5x más rápido que json.dump;
+    # el pretty-print duplica el tamaño, así que en modo --compact lo omitimos
+    option = orjson.OPT_UTC_Z if args.compact else orjson.OPT_INDENT_2 | orjson.OPT_UTC_Z
+    with open(args.outfile, "wb") as f:
+        f.write(orjson.dumps(output, option=option))
+    print(f"JSON escrito en {args.outfile}")
+
+if __name__ == "__main__":
+    main()